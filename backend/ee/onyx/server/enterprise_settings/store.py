@@ -1,5 +1,7 @@
 import os
-from io import BytesIO
+import threading
+import time
+from functools import lru_cache
 from typing import Any
 from typing import cast
 from typing import IO
@@ -16,7 +18,9 @@ from onyx.configs.constants import ONYX_DEFAULT_APPLICATION_NAME
 from onyx.file_store.file_store import get_default_file_store
 from onyx.key_value_store.factory import get_kv_store
 from onyx.key_value_store.interface import KvKeyNotFoundError
+from onyx.utils.file import FileWithMimeType
 from onyx.utils.logger import setup_logger
+from shared_configs.contextvars import get_current_tenant_id
 
 
 logger = setup_logger()
@@ -24,15 +28,42 @@ logger = setup_logger()
 _LOGO_FILENAME = "__logo__"
 _LOGOTYPE_FILENAME = "__logotype__"
 
+# Settings are read on many request paths but change rarely, so keep a short-lived
+# per-tenant copy in memory rather than going to the KV store on every call.
+# Writes made through this process invalidate immediately; writes from other
+# processes become visible once the TTL expires.
+_SETTINGS_CACHE_TTL = 5.0
+_settings_cache_lock = threading.Lock()
+_settings_cache: dict[str, tuple[float, EnterpriseSettings]] = {}
+_analytics_script_cache: dict[str, tuple[float, str | None]] = {}
+
+# Logos are fetched on every page load, keep them in memory keyed by
+# (tenant id, file id). The longer TTL bounds how stale a logo changed through
+# another process can get.
+_LOGO_CACHE_TTL = 60.0
+_logo_cache_lock = threading.Lock()
+_logo_cache: dict[tuple[str, str], tuple[float, FileWithMimeType]] = {}
+
 
 def load_settings() -> EnterpriseSettings:
-    """Loads settings data directly from DB. This should be used primarily
+    """Loads settings data as stored in the DB. This should be used primarily
     for checking what is actually in the DB, aka for editing and saving back settings.
 
+    Results are served from a per-tenant in-memory cache, so changes made by other
+    processes may take up to _SETTINGS_CACHE_TTL seconds to show up. Changes made
+    through store_settings in this process are visible immediately.
+
     Runtime settings actually used by the application should be checked with
     load_runtime_settings as defaults may be applied at runtime.
     """
 
+    tenant_id = get_current_tenant_id()
+    with _settings_cache_lock:
+        cached = _settings_cache.get(tenant_id)
+    if cached is not None and time.monotonic() - cached[0] < _SETTINGS_CACHE_TTL:
+        # hand out a copy so callers mutating the result don't leak into the cache
+        return cached[1].model_copy(deep=True)
+
     dynamic_config_store = get_kv_store()
     try:
         settings = EnterpriseSettings(
@@ -42,6 +73,12 @@ def load_settings() -> EnterpriseSettings:
         settings = EnterpriseSettings()
         dynamic_config_store.store(KV_ENTERPRISE_SETTINGS_KEY, settings.model_dump())
 
+    with _settings_cache_lock:
+        _settings_cache[tenant_id] = (
+            time.monotonic(),
+            settings.model_copy(deep=True),
+        )
+
     return settings
 
 
@@ -50,6 +87,12 @@ def store_settings(settings: EnterpriseSettings) -> None:
 
     get_kv_store().store(KV_ENTERPRISE_SETTINGS_KEY, settings.model_dump())
 
+    with _settings_cache_lock:
+        _settings_cache[get_current_tenant_id()] = (
+            time.monotonic(),
+            settings.model_copy(deep=True),
+        )
+
 
 def load_runtime_settings() -> EnterpriseSettings:
     """Loads settings from DB and applies any defaults or transformations for use
@@ -68,11 +111,24 @@ _CUSTOM_ANALYTICS_SECRET_KEY = os.environ.get("CUSTOM_ANALYTICS_SECRET_KEY")
 
 
 def load_analytics_script() -> str | None:
+    tenant_id = get_current_tenant_id()
+    with _settings_cache_lock:
+        cached = _analytics_script_cache.get(tenant_id)
+    if cached is not None and time.monotonic() - cached[0] < _SETTINGS_CACHE_TTL:
+        return cached[1]
+
     dynamic_config_store = get_kv_store()
     try:
-        return cast(str, dynamic_config_store.load(KV_CUSTOM_ANALYTICS_SCRIPT_KEY))
+        script: str | None = cast(
+            str, dynamic_config_store.load(KV_CUSTOM_ANALYTICS_SCRIPT_KEY)
+        )
     except KvKeyNotFoundError:
-        return None
+        script = None
+
+    with _settings_cache_lock:
+        _analytics_script_cache[tenant_id] = (time.monotonic(), script)
+
+    return script
 
 
 def store_analytics_script(analytics_script_upload: AnalyticsScriptUpload) -> None:
@@ -84,18 +140,29 @@ def store_analytics_script(analytics_script_upload: AnalyticsScriptUpload) -> No
 
     get_kv_store().store(KV_CUSTOM_ANALYTICS_SCRIPT_KEY, analytics_script_upload.script)
 
+    with _settings_cache_lock:
+        _analytics_script_cache[get_current_tenant_id()] = (
+            time.monotonic(),
+            analytics_script_upload.script,
+        )
+
+
+_LOGO_EXTENSION_TO_MIME_TYPE = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+}
+
 
 def is_valid_file_type(filename: str) -> bool:
-    valid_extensions = (".png", ".jpg", ".jpeg")
-    return filename.endswith(valid_extensions)
+    ext = os.path.splitext(filename)[1].lower()
+    return ext in _LOGO_EXTENSION_TO_MIME_TYPE
 
 
+@lru_cache(maxsize=128)
 def guess_file_type(filename: str) -> str:
-    if filename.lower().endswith(".png"):
-        return "image/png"
-    elif filename.lower().endswith(".jpg") or filename.lower().endswith(".jpeg"):
-        return "image/jpeg"
-    return "application/octet-stream"
+    ext = os.path.splitext(filename)[1].lower()
+    return _LOGO_EXTENSION_TO_MIME_TYPE.get(ext, "application/octet-stream")
 
 
 def upload_logo(file: UploadFile | str, is_logotype: bool = False) -> bool:
@@ -109,9 +176,8 @@ def upload_logo(file: UploadFile | str, is_logotype: bool = False) -> bool:
             )
             return False
 
-        with open(file, "rb") as file_handle:
-            file_content = file_handle.read()
-        content = BytesIO(file_content)
+        # closed below once the file store has consumed it
+        content = open(file, "rb")
         display_name = file
         file_type = guess_file_type(file)
 
@@ -126,17 +192,41 @@ def upload_logo(file: UploadFile | str, is_logotype: bool = False) -> bool:
         display_name = file.filename
         file_type = file.content_type or "image/jpeg"
 
+    file_id = _LOGOTYPE_FILENAME if is_logotype else _LOGO_FILENAME
     file_store = get_default_file_store()
-    file_store.save_file(
-        content=content,
-        display_name=display_name,
-        file_origin=FileOrigin.OTHER,
-        file_type=file_type,
-        file_id=_LOGOTYPE_FILENAME if is_logotype else _LOGO_FILENAME,
-    )
+    try:
+        file_store.save_file(
+            content=content,
+            display_name=display_name,
+            file_origin=FileOrigin.OTHER,
+            file_type=file_type,
+            file_id=file_id,
+        )
+    finally:
+        if isinstance(file, str):
+            content.close()
+
+    with _logo_cache_lock:
+        _logo_cache.pop((get_current_tenant_id(), file_id), None)
     return True
 
 
+def load_logo_cached(file_id: str) -> FileWithMimeType | None:
+    """Loads a logo from the file store, serving repeat requests from memory."""
+    cache_key = (get_current_tenant_id(), file_id)
+    with _logo_cache_lock:
+        cached = _logo_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _LOGO_CACHE_TTL:
+        return cached[1]
+
+    onyx_file = get_default_file_store().get_file_with_mime_type(file_id)
+    if onyx_file is not None:
+        with _logo_cache_lock:
+            _logo_cache[cache_key] = (time.monotonic(), onyx_file)
+
+    return onyx_file
+
+
 def get_logo_filename() -> str:
     return _LOGO_FILENAME
 
@@ -1,18 +1,32 @@
+import base64
+import contextvars
 import html
-import io
 import os
+import random
 import re
+import tempfile
+import threading
 import time
 from collections.abc import Generator
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from datetime import datetime
 from datetime import timezone
+from functools import lru_cache
 from typing import Any
 from typing import cast
+from typing import IO
 from urllib.parse import unquote
+from urllib.parse import urlparse
 
 import msal  # type: ignore
+import orjson
 import requests
+from office365.entity_collection import EntityCollection  # type: ignore
 from office365.graph_client import GraphClient  # type: ignore
+from office365.onedrive.drives.drive import Drive  # type: ignore
 from office365.onedrive.driveitems.driveItem import DriveItem  # type: ignore
 from office365.onedrive.sites.site import Site  # type: ignore
 from office365.onedrive.sites.sites_with_root import SitesWithRoot  # type: ignore
@@ -39,6 +53,42 @@ logger = setup_logger()
 
 ASPX_EXTENSION = ".aspx"
 REQUEST_TIMEOUT = 10
+GRAPH_API_BASE_URL = "https://graph.microsoft.com/v1.0"
+# Graph caps a single $batch request at 20 sub-requests
+GRAPH_BATCH_MAX_REQUESTS = 20
+# How often sub-requests throttled inside a $batch are retried in a new $batch
+# before falling back to downloading those items one by one
+GRAPH_BATCH_MAX_RETRIES = 3
+# Max number of $batch groups downloaded / converted concurrently
+MAX_DOWNLOAD_WORKERS = 8
+# Sustained Graph request rate shared by all workers in this process
+GRAPH_REQUESTS_PER_SECOND = 20
+# Once Graph reports fewer remaining requests than this, pause briefly
+# before continuing rather than waiting to be throttled with a 429
+RATE_LIMIT_REMAINING_THRESHOLD = 10
+RATE_LIMIT_PROACTIVE_SLEEP_SECONDS = 0.2
+MAX_BACKOFF_SECONDS = 60
+# Refresh cached access tokens this long before they actually expire, so that a
+# token handed out for a request (or a page of one) doesn't expire mid-flight.
+# MSAL itself refreshes tokens 5 minutes ahead of expiry.
+TOKEN_EXPIRY_BUFFER_SECONDS = 300
+# Downloads are streamed into spooled temp files which only spill to disk
+# once they grow past this size
+SPOOLED_FILE_MAX_MEMORY_BYTES = 8 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# The DriveItem properties the connector actually reads. "folder" is needed to
+# recurse into sub folders, "file" to tell files apart from other items.
+DRIVEITEM_SELECT_FIELDS = [
+    "id",
+    "name",
+    "size",
+    "webUrl",
+    "lastModifiedDateTime",
+    "lastModifiedBy",
+    "parentReference",
+    "file",
+    "folder",
+]
 
 
 class SiteDescriptor(BaseModel):
@@ -57,47 +107,146 @@ class SiteDescriptor(BaseModel):
     folder_path: str | None
 
 
-def _sleep_and_retry(query_obj: Any, method_name: str, max_retries: int = 3) -> Any:
-    """
-    Execute a SharePoint query with retry logic for rate limiting.
-    """
-    for attempt in range(max_retries + 1):
-        try:
-            return query_obj.execute_query()
-        except ClientRequestException as e:
-            if (
-                e.response
-                and e.response.status_code in [429, 503]
-                and attempt < max_retries
-            ):
-                logger.warning(
-                    f"Rate limit exceeded on {method_name}, attempt {attempt + 1}/{max_retries + 1}, sleeping and retrying"
+class _AdaptiveConcurrencyLimit:
+    """Additive-increase / multiplicative-decrease limit on concurrent Graph work.
+
+    The limit grows by one after every unthrottled request and halves whenever
+    Graph responds with a 429, so parallel downloads settle just under the
+    tenant's rate limit instead of hammering it."""
+
+    def __init__(self, max_limit: int) -> None:
+        self.max_limit = max_limit
+        self.limit = max_limit
+        self._lock = threading.Lock()
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.limit = min(self.max_limit, self.limit + 1)
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            self.limit = max(1, self.limit // 2)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket so that parallel workers cooperatively stay under
+    the Graph request rate instead of each discovering the limit via 429s."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1) -> None:
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._last_refill) * self.rate
                 )
-                retry_after = e.response.headers.get("Retry-After")
-                if retry_after:
-                    sleep_time = int(retry_after)
+                self._last_refill = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait_time = (tokens - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+
+_graph_request_limiter = _TokenBucket(
+    rate=GRAPH_REQUESTS_PER_SECOND, capacity=GRAPH_REQUESTS_PER_SECOND
+)
+
+
+def _slow_down_if_near_rate_limit(response: requests.Response) -> None:
+    remaining = response.headers.get("x-ratelimit-remaining")
+    if remaining is None:
+        return
+
+    try:
+        if int(remaining) < RATE_LIMIT_REMAINING_THRESHOLD:
+            logger.debug(
+                f"Only {remaining} Graph requests remaining, slowing down proactively"
+            )
+            time.sleep(RATE_LIMIT_PROACTIVE_SLEEP_SECONDS)
+    except ValueError:
+        pass
+
+
+def _escape_odata_string(value: str) -> str:
+    """Escape a value for use inside a single-quoted OData string literal."""
+    return value.replace("'", "''")
+
+
+def _get_retry_sleep_seconds(retry_after: str | None, attempt: int) -> float:
+    """Honor Graph's Retry-After header if present, otherwise back off
+    exponentially with 2^attempt * 5 seconds, jittered so that parallel workers
+    don't all retry at the same moment."""
+    if retry_after:
+        try:
+            return int(retry_after)
+        except ValueError:
+            pass
+
+    return min(MAX_BACKOFF_SECONDS, (2**attempt) * 5) * (0.5 + random.random() * 0.5)
+
+
+def _to_graph_datetime(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _driveitem_from_json(drive: Drive, item_json: dict[str, Any]) -> DriveItem:
+    """Build a DriveItem from a raw Graph response, the same way office365 maps
+    the responses of the queries it issues itself."""
+    driveitem = drive.items.create_typed_object()
+    for key, value in item_json.items():
+        driveitem.set_property(key, value, False)
+    return driveitem
+
+
+def _get_files_recursively(folder: DriveItem, page_size: int) -> EntityCollection:
+    """Equivalent of DriveItem.get_files(recursive=True) that only requests
+    DRIVEITEM_SELECT_FIELDS for each item. Calling .select() on the result of
+    get_files does not reach the per-folder children queries it issues."""
+    files = EntityCollection(folder.context, DriveItem, folder.resource_path)
+
+    def _list_children(parent: DriveItem) -> None:
+        def _after_loaded(children: EntityCollection) -> None:
+            # wait until every page of this folder has been loaded
+            if children.has_next:
+                return
+
+            for child in children:
+                if child.is_folder:
+                    if child.folder.childCount > 0:
+                        _list_children(child)
                 else:
-                    # Exponential backoff: 2^attempt * 5 seconds
-                    sleep_time = min(30, (2**attempt) * 5)
+                    files.add_child(child)
 
-                logger.info(f"Sleeping for {sleep_time} seconds before retry")
-                time.sleep(sleep_time)
-            else:
-                # Either not a rate limit error, or we've exhausted retries
-                if e.response and e.response.status_code == 429:
-                    logger.error(
-                        f"Rate limit retry exhausted for {method_name} after {max_retries} attempts"
-                    )
-                raise e
+        parent.children.select(DRIVEITEM_SELECT_FIELDS).get_all(
+            page_size=page_size, page_loaded=_after_loaded
+        )
 
+    _list_children(folder)
+    return files
 
-def _convert_driveitem_to_document(
-    driveitem: DriveItem,
-    drive_name: str,
-) -> Document | None:
-    # Check file size before downloading
+
+def _is_in_folder(parent_path: str, folder_path: str) -> bool:
+    """Check whether an item whose parentReference.path is `parent_path` lives in
+    `folder_path` or one of its subfolders. Parent paths are in the format
+    /drives/{drive_id}/root:/folder/path and may be percent-encoded."""
+    item_path = unquote(parent_path.partition("root:")[2]).strip("/")
+    wanted_path = folder_path.strip("/")
+    return item_path == wanted_path or item_path.startswith(wanted_path + "/")
+
+
+def _exceeds_size_threshold(driveitem: DriveItem) -> bool:
+    """Check the file size before downloading so oversized files are skipped."""
     try:
-        size_value = getattr(driveitem, "size", None)
+        # DriveItem has no accessor for size, it only lives in the raw properties
+        size_value = driveitem.properties.get("size")
         if size_value is not None:
             file_size = int(size_value)
             if file_size > SHAREPOINT_CONNECTOR_SIZE_THRESHOLD:
@@ -105,7 +254,7 @@ def _convert_driveitem_to_document(
                     f"File '{driveitem.name}' exceeds size threshold of {SHAREPOINT_CONNECTOR_SIZE_THRESHOLD} bytes. "
                     f"File size: {file_size} bytes. Skipping."
                 )
-                return None
+                return True
         else:
             logger.warning(
                 f"Could not access file size for '{driveitem.name}' Proceeding with download."
@@ -115,14 +264,24 @@ def _convert_driveitem_to_document(
             f"Could not access file size for '{driveitem.name}': {e}. Proceeding with download."
         )
 
-    # Proceed with download if size is acceptable or not available
-    content = _sleep_and_retry(driveitem.get_content(), "get_content")
-    if content is None:
-        logger.warning(f"Could not access content for '{driveitem.name}'")
-        return None
+    return False
 
+
+@lru_cache(maxsize=4096)
+def _get_expert_info(display_name: str | None, email: str | None) -> BasicExpertInfo:
+    """A handful of users modify most files in a library, so share one
+    BasicExpertInfo per user rather than building a new one for every item.
+    The returned objects must not be mutated."""
+    return BasicExpertInfo(display_name=display_name, email=email)
+
+
+def _convert_driveitem_to_document(
+    driveitem: DriveItem,
+    drive_name: str,
+    content: IO[bytes],
+) -> Document:
     file_text = extract_file_text(
-        file=io.BytesIO(content.value),
+        file=content,
         file_name=driveitem.name,
         break_on_unprocessable=False,
     )
@@ -134,9 +293,9 @@ def _convert_driveitem_to_document(
         semantic_identifier=driveitem.name,
         doc_updated_at=driveitem.last_modified_datetime.replace(tzinfo=timezone.utc),
         primary_owners=[
-            BasicExpertInfo(
-                display_name=driveitem.last_modified_by.user.displayName,
-                email=driveitem.last_modified_by.user.email,
+            _get_expert_info(
+                driveitem.last_modified_by.user.displayName,
+                driveitem.last_modified_by.user.email,
             )
         ],
         metadata={"drive": drive_name},
@@ -302,6 +461,10 @@ class SharepointConnector(LoadConnector, PollConnector):
         )
         self.msal_app: msal.ConfidentialClientApplication | None = None
         self.include_site_pages = include_site_pages
+        self._download_concurrency = _AdaptiveConcurrencyLimit(MAX_DOWNLOAD_WORKERS)
+        self._cached_token: dict[str, Any] | None = None
+        self._token_expiry: float = 0
+        self._token_lock = threading.Lock()
 
     @property
     def graph_client(self) -> GraphClient:
@@ -314,33 +477,149 @@ class SharepointConnector(LoadConnector, PollConnector):
     def _extract_site_and_drive_info(site_urls: list[str]) -> list[SiteDescriptor]:
         site_data_list = []
         for url in site_urls:
-            parts = url.strip().split("/")
-            if "sites" in parts:
-                sites_index = parts.index("sites")
-                site_url = "/".join(parts[: sites_index + 2])
-                remaining_parts = parts[sites_index + 2 :]
-
-                # Extract drive name and folder path
-                if remaining_parts:
-                    drive_name = unquote(remaining_parts[0])
-                    folder_path = (
-                        "/".join(unquote(part) for part in remaining_parts[1:])
-                        if len(remaining_parts) > 1
-                        else None
-                    )
-                else:
-                    drive_name = None
-                    folder_path = None
-
-                site_data_list.append(
-                    SiteDescriptor(
-                        url=site_url,
-                        drive_name=drive_name,
-                        folder_path=folder_path,
-                    )
+            parsed_url = urlparse(url.strip())
+            path_prefix, sites_marker, site_path = parsed_url.path.partition("/sites/")
+            if not sites_marker:
+                continue
+
+            # site_path is "<site name>[/<drive name>[/<folder path>]]"
+            site_name, _, drive_and_folder = site_path.partition("/")
+            drive_part, _, folder_part = drive_and_folder.strip("/").partition("/")
+
+            site_data_list.append(
+                SiteDescriptor(
+                    url=f"{parsed_url.scheme}://{parsed_url.netloc}{path_prefix}/sites/{site_name}",
+                    drive_name=unquote(drive_part) or None,
+                    folder_path=unquote(folder_part) or None,
                 )
+            )
         return site_data_list
 
+    @staticmethod
+    def _fetch_drives_by_name(site: Site, drive_name: str) -> list[Drive]:
+        """Fetch only the drives matching the requested name, letting Graph do the
+        filtering rather than listing every library in the site."""
+        # The default "Documents" drive is shown as "Shared Documents" in SharePoint
+        drive_names = [drive_name]
+        if drive_name == "Shared Documents":
+            drive_names.append("Documents")
+
+        name_filter = " or ".join(
+            f"name eq '{_escape_odata_string(name)}'" for name in drive_names
+        )
+        try:
+            drives = (
+                site.drives.get()
+                .filter(name_filter)
+                .select(["id", "name"])
+                .execute_query()
+            )
+        except ClientRequestException as e:
+            if e.response is None or e.response.status_code != 400:
+                raise
+            # Not every tenant accepts $filter on drives, fall back to listing them
+            logger.debug(
+                f"Drive filter rejected, listing all drives instead: {e.response.text}"
+            )
+            drives = site.drives.get().execute_query()
+
+        # Still check client side in case the filter was ignored
+        return [drive for drive in drives if drive.name in drive_names]
+
+    def _get_graph_pages(
+        self, url: str, params: dict[str, str]
+    ) -> Generator[dict[str, Any], None, None]:
+        """Issue a raw Graph GET and follow @odata.nextLink, yielding each page."""
+        next_url: str | None = url
+        next_params: dict[str, str] | None = params
+        while next_url:
+            # long paginations can outlive a token, so get one per page. This is
+            # cheap as long as the cached token is still valid.
+            token_data = self._acquire_token()
+            access_token = token_data.get("access_token")
+            if not access_token:
+                raise RuntimeError("Failed to acquire access token")
+
+            _graph_request_limiter.acquire()
+            response = requests.get(
+                next_url,
+                headers={"Authorization": f"Bearer {access_token}"},
+                params=next_params,
+                timeout=REQUEST_TIMEOUT,
+            )
+            response.raise_for_status()
+            _slow_down_if_near_rate_limit(response)
+            page = orjson.loads(response.content)
+            yield page
+
+            # the next link already carries the query parameters
+            next_url = page.get("@odata.nextLink")
+            next_params = None
+
+    def _fetch_driveitems_delta(
+        self, drive: Drive, start: datetime
+    ) -> list[DriveItem] | None:
+        """Fetch the files in a drive that changed since `start` using Graph's delta
+        query, so polling cost scales with the number of changes rather than the
+        size of the drive. SharePoint accepts a timestamp in place of a delta token,
+        so no sync state has to be kept between polls.
+
+        Returns None if the delta query fails, in which case the caller should fall
+        back to listing the whole drive."""
+        driveitems: list[DriveItem] = []
+        try:
+            for delta_page in self._get_graph_pages(
+                f"{GRAPH_API_BASE_URL}/drives/{drive.id}/root/delta",
+                params={
+                    "token": _to_graph_datetime(start),
+                    "$select": ",".join(DRIVEITEM_SELECT_FIELDS + ["deleted"]),
+                },
+            ):
+                for item_json in delta_page.get("value", []):
+                    # delta also reports folders and deleted items
+                    if "file" not in item_json or "deleted" in item_json:
+                        continue
+                    driveitems.append(_driveitem_from_json(drive, item_json))
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            logger.warning(
+                f"Delta query failed for drive '{drive.name}', listing all items instead: {e}"
+            )
+            return None
+
+        return driveitems
+
+    def _list_driveitems(
+        self, drive: Drive, folder_path: str | None
+    ) -> list[DriveItem]:
+        root_folder = drive.root
+        if folder_path:
+            # If a specific folder is requested, navigate to it
+            for folder_part in folder_path.split("/"):
+                root_folder = root_folder.get_by_path(folder_part)
+
+        # Get all items recursively
+        query = _get_files_recursively(root_folder, page_size=1000)
+        driveitems: list[DriveItem] = list(query.execute_query())
+
+        # Filter items based on folder path if specified
+        if folder_path:
+            # Filter items to ensure they're in the specified folder or its subfolders
+            all_driveitems = driveitems
+            driveitems = [
+                item
+                for item in all_driveitems
+                if _is_in_folder(item.parent_reference.path, folder_path)
+            ]
+
+            if len(driveitems) == 0:
+                all_paths = [item.parent_reference.path for item in all_driveitems]
+                logger.warning(
+                    f"Nothing found for folder '{folder_path}' "
+                    f"in; any of valid paths: {all_paths}"
+                )
+
+        return driveitems
+
     def _fetch_driveitems(
         self,
         site_descriptor: SiteDescriptor,
@@ -348,43 +627,46 @@ class SharepointConnector(LoadConnector, PollConnector):
         end: datetime | None = None,
     ) -> list[tuple[DriveItem, str]]:
         final_driveitems: list[tuple[DriveItem, str]] = []
+        # office365 parses Graph timestamps into naive UTC datetimes, so compare
+        # against naive bounds rather than making every item tz-aware
+        naive_start = (
+            start.astimezone(timezone.utc).replace(tzinfo=None) if start else None
+        )
+        naive_end = end.astimezone(timezone.utc).replace(tzinfo=None) if end else None
         try:
             site = self.graph_client.sites.get_by_url(site_descriptor.url)
 
-            # Get all drives in the site
-            drives = site.drives.get().execute_query()
-            logger.debug(f"Found drives: {[drive.name for drive in drives]}")
-
-            # Filter drives based on the requested drive name
             if site_descriptor.drive_name:
-                drives = [
-                    drive
-                    for drive in drives
-                    if drive.name == site_descriptor.drive_name
-                    or (
-                        drive.name == "Documents"
-                        and site_descriptor.drive_name == "Shared Documents"
-                    )
-                ]
+                drives = self._fetch_drives_by_name(site, site_descriptor.drive_name)
                 if not drives:
                     logger.warning(f"Drive '{site_descriptor.drive_name}' not found")
                     return []
+            else:
+                # Get all drives in the site
+                drives = site.drives.get().execute_query()
+            logger.debug(f"Found drives: {[drive.name for drive in drives]}")
 
             # Process each matching drive
             for drive in drives:
                 try:
-                    root_folder = drive.root
-                    if site_descriptor.folder_path:
-                        # If a specific folder is requested, navigate to it
-                        for folder_part in site_descriptor.folder_path.split("/"):
-                            root_folder = root_folder.get_by_path(folder_part)
-
-                    # Get all items recursively
-                    query = root_folder.get_files(
-                        recursive=True,
-                        page_size=1000,
-                    )
-                    driveitems = query.execute_query()
+                    driveitems: list[DriveItem] | None = None
+                    # Let Graph apply the time window when the whole drive is
+                    # being indexed. Delta responses don't include parent paths, so
+                    # folder scoped polls list the folder instead. Graph's search
+                    # endpoint can't be used for those either: it is served from
+                    # an asynchronously updated index, so files edited close to
+                    # `end` could be missing from it and never be picked up.
+                    if (
+                        start is not None
+                        and end is not None
+                        and not site_descriptor.folder_path
+                    ):
+                        driveitems = self._fetch_driveitems_delta(drive, start)
+
+                    if driveitems is None:
+                        driveitems = self._list_driveitems(
+                            drive, site_descriptor.folder_path
+                        )
                     logger.debug(
                         f"Found {len(driveitems)} items in drive '{drive.name}'"
                     )
@@ -394,40 +676,14 @@ class SharepointConnector(LoadConnector, PollConnector):
                         "Shared Documents" if drive.name == "Documents" else drive.name
                     )
 
-                    # Filter items based on folder path if specified
-                    if site_descriptor.folder_path:
-                        # Filter items to ensure they're in the specified folder or its subfolders
-                        # The path will be in format: /drives/{drive_id}/root:/folder/path
+                    # Filter items based on time window if specified. The full
+                    # listing is unfiltered and delta results may include changes
+                    # made after `end`.
+                    if naive_start is not None and naive_end is not None:
                         driveitems = [
                             item
                             for item in driveitems
-                            if any(
-                                path_part == site_descriptor.folder_path
-                                or path_part.startswith(
-                                    site_descriptor.folder_path + "/"
-                                )
-                                for path_part in item.parent_reference.path.split(
-                                    "root:/"
-                                )[1].split("/")
-                            )
-                        ]
-                        if len(driveitems) == 0:
-                            all_paths = [
-                                item.parent_reference.path for item in driveitems
-                            ]
-                            logger.warning(
-                                f"Nothing found for folder '{site_descriptor.folder_path}' "
-                                f"in; any of valid paths: {all_paths}"
-                            )
-
-                    # Filter items based on time window if specified
-                    if start is not None and end is not None:
-                        driveitems = [
-                            item
-                            for item in driveitems
-                            if start
-                            <= item.last_modified_datetime.replace(tzinfo=timezone.utc)
-                            <= end
+                            if naive_start <= item.last_modified_datetime <= naive_end
                         ]
                         logger.debug(
                             f"Found {len(driveitems)} items within time window in drive '{drive.name}'"
@@ -493,37 +749,18 @@ class SharepointConnector(LoadConnector, PollConnector):
         site.execute_query()  # Execute the query to actually fetch the data
         site_id = site.id
 
-        # Get the token acquisition function from the GraphClient
-        token_data = self._acquire_token()
-        access_token = token_data.get("access_token")
-        if not access_token:
-            raise RuntimeError("Failed to acquire access token")
-
         # Construct the SharePoint Pages API endpoint
         # Using API directly, since the Graph Client doesn't support the Pages API
-        pages_endpoint = f"https://graph.microsoft.com/v1.0/sites/{site_id}/pages/microsoft.graph.sitePage"
-
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
-
-        # Add expand parameter to get canvas layout content
-        params = {"$expand": "canvasLayout"}
-
-        response = requests.get(
-            pages_endpoint, headers=headers, params=params, timeout=REQUEST_TIMEOUT
+        pages_endpoint = (
+            f"{GRAPH_API_BASE_URL}/sites/{site_id}/pages/microsoft.graph.sitePage"
         )
-        response.raise_for_status()
-        pages_data = response.json()
-        all_pages = pages_data.get("value", [])
-
-        # Handle pagination if there are more pages
-        while "@odata.nextLink" in pages_data:
-            next_url = pages_data["@odata.nextLink"]
-            response = requests.get(next_url, headers=headers, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-            pages_data = response.json()
+
+        all_pages: list[dict[str, Any]] = []
+        for pages_data in self._get_graph_pages(
+            # Add expand parameter to get canvas layout content
+            pages_endpoint,
+            params={"$expand": "canvasLayout"},
+        ):
             all_pages.extend(pages_data.get("value", []))
 
         logger.debug(f"Found {len(all_pages)} site pages in {site_descriptor.url}")
@@ -549,6 +786,260 @@ class SharepointConnector(LoadConnector, PollConnector):
 
         return all_pages
 
+    def _post_content_batch(
+        self,
+        driveitems: list[DriveItem],
+        request_ids: list[str],
+    ) -> list[dict[str, Any]]:
+        """Request the content of driveitems[id] for each id in a single $batch.
+        Returns the sub-responses, or an empty list if the batch itself failed."""
+        # retries may wait long enough for the previous token to expire
+        token_data = self._acquire_token()
+        access_token = token_data.get("access_token")
+        if not access_token:
+            raise RuntimeError("Failed to acquire access token")
+
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+        }
+        batch_requests = []
+        for request_id in request_ids:
+            driveitem = driveitems[int(request_id)]
+            batch_requests.append(
+                {
+                    "id": request_id,
+                    "method": "GET",
+                    "url": f"/drives/{driveitem.parent_reference.driveId}/items/{driveitem.id}/content",
+                }
+            )
+
+        try:
+            # Graph throttles each sub-request of a $batch individually
+            _graph_request_limiter.acquire(len(batch_requests))
+            response = requests.post(
+                f"{GRAPH_API_BASE_URL}/$batch",
+                headers=headers,
+                json={"requests": batch_requests},
+                timeout=REQUEST_TIMEOUT,
+            )
+            response.raise_for_status()
+            _slow_down_if_near_rate_limit(response)
+            return orjson.loads(response.content).get("responses", [])
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            logger.warning(
+                f"Batch content download failed, falling back to per-file downloads: {e}"
+            )
+            return []
+
+    def _download_driveitem_content(
+        self, driveitem: DriveItem, file_object: IO[bytes], max_retries: int = 3
+    ) -> None:
+        """Stream the content of a single drive item into file_object.
+
+        This runs on the download threads, so it deliberately doesn't go through
+        office365: its GraphClient keeps a single shared query queue and
+        download_session writes the content from an after_execute hook, which
+        fires for whichever request is executed next on any thread."""
+        url = f"{GRAPH_API_BASE_URL}/drives/{driveitem.parent_reference.driveId}/items/{driveitem.id}/content"
+        for attempt in range(max_retries + 1):
+            token_data = self._acquire_token()
+            access_token = token_data.get("access_token")
+            if not access_token:
+                raise RuntimeError("Failed to acquire access token")
+
+            _graph_request_limiter.acquire()
+            # Graph redirects to a pre-authenticated download url, requests drops
+            # the Authorization header when following it to another host
+            with requests.get(
+                url,
+                headers={"Authorization": f"Bearer {access_token}"},
+                stream=True,
+                timeout=REQUEST_TIMEOUT,
+            ) as response:
+                if response.status_code not in (429, 503) or attempt == max_retries:
+                    response.raise_for_status()
+                    _slow_down_if_near_rate_limit(response)
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        file_object.write(chunk)
+                    return
+
+                sleep_time = _get_retry_sleep_seconds(
+                    response.headers.get("Retry-After"), attempt
+                )
+
+            self._download_concurrency.on_throttle()
+            logger.warning(
+                f"Rate limit exceeded downloading '{driveitem.name}', attempt "
+                f"{attempt + 1}/{max_retries + 1}, retrying in {sleep_time:.2f} seconds"
+            )
+            time.sleep(sleep_time)
+
+    def _fetch_batch_responses(
+        self, driveitems: list[DriveItem]
+    ) -> dict[int, dict[str, Any]]:
+        """Request the content of up to GRAPH_BATCH_MAX_REQUESTS drive items with a
+        single Graph $batch call. Returns the sub-responses keyed by the index of
+        their drive item.
+
+        Sub-requests throttled by Graph are retried in a new $batch once their
+        Retry-After has passed. Items missing from the result could not be
+        resolved through the batch and have to be downloaded individually."""
+        if len(driveitems) > GRAPH_BATCH_MAX_REQUESTS:
+            raise ValueError(
+                f"Cannot batch more than {GRAPH_BATCH_MAX_REQUESTS} requests at once"
+            )
+
+        # sub-request ids index into driveitems so retries can reuse them
+        pending_ids = [str(idx) for idx in range(len(driveitems))]
+        batch_responses: list[dict[str, Any]] = []
+        for attempt in range(GRAPH_BATCH_MAX_RETRIES + 1):
+            responses = self._post_content_batch(driveitems, pending_ids)
+            throttled = [
+                batch_response
+                for batch_response in responses
+                if batch_response.get("status") in (429, 503)
+            ]
+            if throttled:
+                self._download_concurrency.on_throttle()
+            elif responses:
+                self._download_concurrency.on_success()
+
+            batch_responses.extend(
+                batch_response
+                for batch_response in responses
+                if batch_response.get("status") not in (429, 503)
+            )
+            # anything still throttled after the last attempt is left out and
+            # gets downloaded individually
+            if not throttled or attempt == GRAPH_BATCH_MAX_RETRIES:
+                break
+
+            sleep_time = max(
+                _get_retry_sleep_seconds(
+                    batch_response.get("headers", {}).get("Retry-After"), attempt
+                )
+                for batch_response in throttled
+            )
+            logger.info(
+                f"{len(throttled)} batch sub-requests throttled, retrying them in "
+                f"{sleep_time:.2f} seconds"
+            )
+            time.sleep(sleep_time)
+            pending_ids = [batch_response["id"] for batch_response in throttled]
+
+        return {
+            int(batch_response["id"]): batch_response
+            for batch_response in batch_responses
+        }
+
+    def _write_batch_response_content(
+        self,
+        driveitem: DriveItem,
+        batch_response: dict[str, Any],
+        file_object: IO[bytes],
+    ) -> bool:
+        """Write the content referenced by a $batch sub-response into file_object.
+        Returns False if the content has to be downloaded individually instead.
+
+        Graph answers content requests with a 302 to a pre-authenticated download
+        url, which is streamed directly (without our bearer token)."""
+        try:
+            status = batch_response.get("status")
+            if status == 302:
+                location = batch_response.get("headers", {}).get("Location")
+                if location:
+                    with requests.get(
+                        location, stream=True, timeout=REQUEST_TIMEOUT
+                    ) as download:
+                        download.raise_for_status()
+                        for chunk in download.iter_content(
+                            chunk_size=DOWNLOAD_CHUNK_SIZE
+                        ):
+                            file_object.write(chunk)
+                    return True
+            elif status == 200:
+                # binary bodies are base64 encoded inside batch responses
+                body = batch_response.get("body")
+                if isinstance(body, str):
+                    file_object.write(base64.b64decode(body))
+                    return True
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(
+                f"Failed to download '{driveitem.name}' from batch response: {e}"
+            )
+            file_object.seek(0)
+            file_object.truncate()
+
+        return False
+
+    def _process_driveitem_group(
+        self, driveitem_group: list[tuple[DriveItem, str]]
+    ) -> list[Document]:
+        """Resolve the group's content with one $batch call, then download and
+        convert the files one at a time so that each worker only ever holds a
+        single file."""
+        batch_responses = self._fetch_batch_responses(
+            [driveitem for driveitem, _ in driveitem_group]
+        )
+
+        docs: list[Document] = []
+        for idx, (driveitem, drive_name) in enumerate(driveitem_group):
+            logger.debug(f"Processing: {driveitem.web_url}")
+
+            with tempfile.SpooledTemporaryFile(
+                max_size=SPOOLED_FILE_MAX_MEMORY_BYTES
+            ) as content:
+                batch_response = batch_responses.get(idx)
+                if batch_response is None or not self._write_batch_response_content(
+                    driveitem, batch_response, content
+                ):
+                    self._download_driveitem_content(driveitem, content)
+
+                content.seek(0)
+                docs.append(
+                    _convert_driveitem_to_document(driveitem, drive_name, content)
+                )
+        return docs
+
+    def _convert_driveitems_in_parallel(
+        self, driveitems: list[tuple[DriveItem, str]]
+    ) -> Generator[Document, None, None]:
+        """Download and convert drive items in $batch-sized groups on a bounded
+        thread pool, yielding documents as each group completes.
+
+        Only as many groups as the adaptive concurrency limit allows are in flight
+        at once. Each group holds one downloaded file at a time, so at most
+        MAX_DOWNLOAD_WORKERS files are open concurrently."""
+        driveitem_groups = [
+            driveitems[i : i + GRAPH_BATCH_MAX_REQUESTS]
+            for i in range(0, len(driveitems), GRAPH_BATCH_MAX_REQUESTS)
+        ]
+        if not driveitem_groups:
+            return
+
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+            pending: set[Future[list[Document]]] = set()
+            next_group_index = 0
+            while next_group_index < len(driveitem_groups) or pending:
+                while (
+                    next_group_index < len(driveitem_groups)
+                    and len(pending) < self._download_concurrency.limit
+                ):
+                    # Capture the current context so that the thread gets the current tenant ID
+                    pending.add(
+                        executor.submit(
+                            contextvars.copy_context().run,
+                            self._process_driveitem_group,
+                            driveitem_groups[next_group_index],
+                        )
+                    )
+                    next_group_index += 1
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
     def _fetch_from_sharepoint(
         self, start: datetime | None = None, end: datetime | None = None
     ) -> GenerateDocumentsOutput:
@@ -558,14 +1049,15 @@ class SharepointConnector(LoadConnector, PollConnector):
         doc_batch: list[Document] = []
         for site_descriptor in site_descriptors:
             # Fetch regular documents from document libraries
-            driveitems = self._fetch_driveitems(site_descriptor, start=start, end=end)
-            for driveitem, drive_name in driveitems:
-                logger.debug(f"Processing: {driveitem.web_url}")
-
-                # Convert driveitem to document with size checking
-                doc = _convert_driveitem_to_document(driveitem, drive_name)
-                if doc is not None:
-                    doc_batch.append(doc)
+            driveitems = [
+                (driveitem, drive_name)
+                for driveitem, drive_name in self._fetch_driveitems(
+                    site_descriptor, start=start, end=end
+                )
+                if not _exceeds_size_threshold(driveitem)
+            ]
+            for doc in self._convert_driveitems_in_parallel(driveitems):
+                doc_batch.append(doc)
 
                 if len(doc_batch) >= self.batch_size:
                     yield doc_batch
@@ -606,10 +1098,22 @@ class SharepointConnector(LoadConnector, PollConnector):
         if self.msal_app is None:
             raise RuntimeError("MSAL app is not initialized")
 
-        token = self.msal_app.acquire_token_for_client(
-            scopes=["https://graph.microsoft.com/.default"]
-        )
-        return token
+        # Every Graph call asks for a token, so skip MSAL's cache lookup while the
+        # last token is still comfortably valid
+        with self._token_lock:
+            if (
+                self._cached_token is not None
+                and time.monotonic() < self._token_expiry - TOKEN_EXPIRY_BUFFER_SECONDS
+            ):
+                return self._cached_token
+
+            token = self.msal_app.acquire_token_for_client(
+                scopes=["https://graph.microsoft.com/.default"]
+            )
+            if "access_token" in token:
+                self._cached_token = token
+                self._token_expiry = time.monotonic() + int(token.get("expires_in", 0))
+            return token
 
     def load_credentials(self, credentials: dict[str, Any]) -> dict[str, Any] | None:
         sp_client_id = credentials["sp_client_id"]
@@ -622,7 +1126,16 @@ class SharepointConnector(LoadConnector, PollConnector):
             client_id=sp_client_id,
             client_credential=sp_client_secret,
         )
+        with self._token_lock:
+            self._cached_token = None
+            self._token_expiry = 0
         self._graph_client = GraphClient(self._acquire_token)
+        # Every request issued through office365 draws from the same rate limit as
+        # the raw Graph calls made by this connector
+        self._graph_client.before_execute(
+            lambda _: _graph_request_limiter.acquire(), once=False
+        )
+        self._graph_client.after_execute(_slow_down_if_near_rate_limit, once=False)
         return None
 
     def load_from_state(self) -> GenerateDocumentsOutput:
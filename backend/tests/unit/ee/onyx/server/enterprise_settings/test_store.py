@@ -0,0 +1,213 @@
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from ee.onyx.server.enterprise_settings import store
+from ee.onyx.server.enterprise_settings.models import EnterpriseSettings
+from ee.onyx.server.enterprise_settings.models import AnalyticsScriptUpload
+from onyx.configs.constants import KV_CUSTOM_ANALYTICS_SCRIPT_KEY
+from onyx.configs.constants import KV_ENTERPRISE_SETTINGS_KEY
+from onyx.key_value_store.interface import KvKeyNotFoundError
+from onyx.utils.file import FileWithMimeType
+
+
+@pytest.fixture
+def mock_kv_store() -> Generator[MagicMock, None, None]:
+    kv_store = MagicMock()
+    kv_store.load.return_value = EnterpriseSettings(
+        application_name="From KV"
+    ).model_dump()
+
+    store._settings_cache.clear()
+    store._analytics_script_cache.clear()
+    with (
+        patch(
+            "ee.onyx.server.enterprise_settings.store.get_kv_store",
+            return_value=kv_store,
+        ),
+        patch(
+            "ee.onyx.server.enterprise_settings.store.get_current_tenant_id",
+            return_value="test_tenant",
+        ),
+    ):
+        yield kv_store
+    store._settings_cache.clear()
+    store._analytics_script_cache.clear()
+
+
+@pytest.fixture
+def mock_file_store() -> Generator[MagicMock, None, None]:
+    file_store = MagicMock()
+    file_store.get_file_with_mime_type.return_value = FileWithMimeType(
+        data=b"logo", mime_type="image/png"
+    )
+
+    store._logo_cache.clear()
+    with (
+        patch(
+            "ee.onyx.server.enterprise_settings.store.get_default_file_store",
+            return_value=file_store,
+        ),
+        patch(
+            "ee.onyx.server.enterprise_settings.store.get_current_tenant_id",
+            return_value="test_tenant",
+        ),
+    ):
+        yield file_store
+    store._logo_cache.clear()
+
+
+def test_load_settings_cache_hit_skips_kv_store(mock_kv_store: MagicMock) -> None:
+    first = store.load_settings()
+    second = store.load_settings()
+
+    assert first.application_name == "From KV"
+    assert second.application_name == "From KV"
+    mock_kv_store.load.assert_called_once()
+
+
+def test_load_settings_returns_copies(mock_kv_store: MagicMock) -> None:
+    settings = store.load_settings()
+    settings.application_name = "Mutated"
+
+    assert store.load_settings().application_name == "From KV"
+
+
+def test_load_settings_reloads_after_ttl(mock_kv_store: MagicMock) -> None:
+    store.load_settings()
+
+    with patch.object(store, "_SETTINGS_CACHE_TTL", 0):
+        store.load_settings()
+
+    assert mock_kv_store.load.call_count == 2
+
+
+def test_store_settings_refreshes_cache(mock_kv_store: MagicMock) -> None:
+    store.load_settings()
+
+    store.store_settings(EnterpriseSettings(application_name="Updated"))
+
+    assert store.load_settings().application_name == "Updated"
+    mock_kv_store.load.assert_called_once()
+    mock_kv_store.store.assert_called_once_with(
+        KV_ENTERPRISE_SETTINGS_KEY,
+        EnterpriseSettings(application_name="Updated").model_dump(),
+    )
+
+
+@pytest.mark.parametrize(
+    "filename,is_valid,mime_type",
+    [
+        ("logo.png", True, "image/png"),
+        ("logo.PNG", True, "image/png"),
+        ("logo.jpg", True, "image/jpeg"),
+        ("logo.JPEG", True, "image/jpeg"),
+        ("/some/dir/logo.jpeg", True, "image/jpeg"),
+        ("logo.gif", False, "application/octet-stream"),
+        ("logo.png.svg", False, "application/octet-stream"),
+        ("png", False, "application/octet-stream"),
+        ("logo", False, "application/octet-stream"),
+    ],
+)
+def test_logo_file_types(filename: str, is_valid: bool, mime_type: str) -> None:
+    assert store.is_valid_file_type(filename) is is_valid
+    assert store.guess_file_type(filename) == mime_type
+
+
+def test_load_analytics_script_cache_hit_skips_kv_store(
+    mock_kv_store: MagicMock,
+) -> None:
+    mock_kv_store.load.return_value = "<script>1</script>"
+
+    assert store.load_analytics_script() == "<script>1</script>"
+    assert store.load_analytics_script() == "<script>1</script>"
+    mock_kv_store.load.assert_called_once_with(KV_CUSTOM_ANALYTICS_SCRIPT_KEY)
+
+
+def test_load_analytics_script_caches_missing_script(
+    mock_kv_store: MagicMock,
+) -> None:
+    mock_kv_store.load.side_effect = KvKeyNotFoundError()
+
+    assert store.load_analytics_script() is None
+    assert store.load_analytics_script() is None
+    mock_kv_store.load.assert_called_once()
+
+
+def test_store_analytics_script_refreshes_cache(mock_kv_store: MagicMock) -> None:
+    mock_kv_store.load.return_value = "<script>1</script>"
+    store.load_analytics_script()
+
+    with patch.object(store, "_CUSTOM_ANALYTICS_SECRET_KEY", "secret"):
+        store.store_analytics_script(
+            AnalyticsScriptUpload(script="<script>2</script>", secret_key="secret")
+        )
+
+    assert store.load_analytics_script() == "<script>2</script>"
+    mock_kv_store.load.assert_called_once()
+    mock_kv_store.store.assert_called_once_with(
+        KV_CUSTOM_ANALYTICS_SCRIPT_KEY, "<script>2</script>"
+    )
+
+
+def test_load_logo_cached_cache_hit_skips_file_store(
+    mock_file_store: MagicMock,
+) -> None:
+    first = store.load_logo_cached(store.get_logo_filename())
+    second = store.load_logo_cached(store.get_logo_filename())
+
+    assert first is not None and first.data == b"logo"
+    assert second is first
+    mock_file_store.get_file_with_mime_type.assert_called_once_with(
+        store.get_logo_filename()
+    )
+
+
+def test_load_logo_cached_keys_by_file_id(mock_file_store: MagicMock) -> None:
+    store.load_logo_cached(store.get_logo_filename())
+    store.load_logo_cached(store.get_logotype_filename())
+
+    assert mock_file_store.get_file_with_mime_type.call_count == 2
+
+
+def test_load_logo_cached_reloads_after_ttl(mock_file_store: MagicMock) -> None:
+    store.load_logo_cached(store.get_logo_filename())
+
+    with patch.object(store, "_LOGO_CACHE_TTL", 0):
+        store.load_logo_cached(store.get_logo_filename())
+
+    assert mock_file_store.get_file_with_mime_type.call_count == 2
+
+
+def test_load_logo_cached_does_not_cache_missing_logo(
+    mock_file_store: MagicMock,
+) -> None:
+    mock_file_store.get_file_with_mime_type.return_value = None
+
+    assert store.load_logo_cached(store.get_logo_filename()) is None
+    assert store.load_logo_cached(store.get_logo_filename()) is None
+    assert mock_file_store.get_file_with_mime_type.call_count == 2
+
+
+def test_upload_logo_evicts_cached_logo(
+    mock_file_store: MagicMock, tmp_path: Path
+) -> None:
+    logo_path = tmp_path / "logo.png"
+    logo_path.write_bytes(b"new logo")
+    store.load_logo_cached(store.get_logo_filename())
+    store.load_logo_cached(store.get_logotype_filename())
+
+    assert store.upload_logo(str(logo_path))
+
+    mock_file_store.save_file.assert_called_once()
+    assert (
+        mock_file_store.save_file.call_args.kwargs["file_id"]
+        == store.get_logo_filename()
+    )
+    # only the uploaded logo is reloaded
+    store.load_logo_cached(store.get_logo_filename())
+    store.load_logo_cached(store.get_logotype_filename())
+    assert mock_file_store.get_file_with_mime_type.call_count == 3
@@ -0,0 +1,94 @@
+from collections.abc import Callable
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import orjson
+import pytest
+import requests
+from office365.graph_client import GraphClient  # type: ignore
+from office365.onedrive.driveitems.driveItem import DriveItem  # type: ignore
+
+from onyx.connectors.sharepoint.connector import _driveitem_from_json
+from onyx.connectors.sharepoint.connector import SharepointConnector
+
+DRIVE_ID = "test-drive-id"
+
+
+@pytest.fixture
+def sharepoint_connector() -> SharepointConnector:
+    connector = SharepointConnector(sites=[])
+    connector._acquire_token = lambda: {"access_token": "test-token"}  # type: ignore
+    return connector
+
+
+@pytest.fixture
+def make_driveitem() -> Callable[..., DriveItem]:
+    """Build DriveItems the same way the connector hydrates Graph responses."""
+    drive = GraphClient(lambda: {"access_token": "test-token"}).drives[DRIVE_ID]
+
+    def _make_driveitem(
+        item_id: str, name: str | None = None, size: int = 10
+    ) -> DriveItem:
+        return _driveitem_from_json(
+            drive,
+            {
+                "id": item_id,
+                "name": name or f"{item_id}.txt",
+                "size": size,
+                "webUrl": f"https://tenant.sharepoint.com/{item_id}",
+                "lastModifiedDateTime": "2024-01-01T00:00:00Z",
+                "lastModifiedBy": {
+                    "user": {"displayName": "Test User", "email": "test@test.com"}
+                },
+                "parentReference": {
+                    "driveId": DRIVE_ID,
+                    "path": f"/drives/{DRIVE_ID}/root:",
+                },
+                "file": {"mimeType": "text/plain"},
+            },
+        )
+
+    return _make_driveitem
+
+
+def mock_response(
+    status_code: int = 200,
+    content: bytes = b"",
+    chunks: list[bytes] | None = None,
+    headers: dict[str, str] | None = None,
+) -> MagicMock:
+    """A requests.Response stand-in that also works as a streaming context manager."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    response.iter_content.return_value = chunks or []
+    response.__enter__.return_value = response
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(
+            f"{status_code} Error"
+        )
+    return response
+
+
+def mock_batch_response(sub_responses: list[dict[str, Any]]) -> MagicMock:
+    return mock_response(content=orjson.dumps({"responses": sub_responses}))
+
+
+@pytest.fixture
+def mock_graph_http() -> Generator[dict[str, Any], None, None]:
+    """Patch the HTTP calls, sleeps and rate limiting of the connector, and stub
+    out the unstructured api key lookup done during text extraction."""
+    with (
+        patch("onyx.connectors.sharepoint.connector.requests.post") as mock_post,
+        patch("onyx.connectors.sharepoint.connector.requests.get") as mock_get,
+        patch("onyx.connectors.sharepoint.connector.time.sleep") as mock_sleep,
+        patch("onyx.connectors.sharepoint.connector._graph_request_limiter.acquire"),
+        patch(
+            "onyx.file_processing.extract_file_text.get_unstructured_api_key",
+            return_value=None,
+        ),
+    ):
+        yield {"post": mock_post, "get": mock_get, "sleep": mock_sleep}
@@ -0,0 +1,59 @@
+from typing import Any
+from unittest.mock import MagicMock
+
+import orjson
+
+from onyx.connectors.sharepoint.connector import SharepointConnector
+from onyx.connectors.sharepoint.connector import TOKEN_EXPIRY_BUFFER_SECONDS
+from tests.unit.onyx.connectors.sharepoint.conftest import mock_response
+
+
+def _connector_with_msal(*tokens: dict[str, Any]) -> SharepointConnector:
+    connector = SharepointConnector(sites=[])
+    connector.msal_app = MagicMock()
+    connector.msal_app.acquire_token_for_client.side_effect = list(tokens)
+    return connector
+
+
+def test_acquire_token_reuses_valid_token() -> None:
+    connector = _connector_with_msal({"access_token": "first", "expires_in": 3600})
+
+    assert connector._acquire_token()["access_token"] == "first"
+    assert connector._acquire_token()["access_token"] == "first"
+    connector.msal_app.acquire_token_for_client.assert_called_once()  # type: ignore
+
+
+def test_acquire_token_refreshes_token_close_to_expiry() -> None:
+    connector = _connector_with_msal(
+        {"access_token": "first", "expires_in": TOKEN_EXPIRY_BUFFER_SECONDS - 1},
+        {"access_token": "second", "expires_in": 3600},
+    )
+
+    assert connector._acquire_token()["access_token"] == "first"
+    assert connector._acquire_token()["access_token"] == "second"
+
+
+def test_get_graph_pages_gets_a_token_per_page(
+    mock_graph_http: dict[str, Any],
+) -> None:
+    connector = SharepointConnector(sites=[])
+    tokens = iter(["first", "second"])
+    connector._acquire_token = lambda: {"access_token": next(tokens)}  # type: ignore
+    mock_graph_http["get"].side_effect = [
+        mock_response(
+            content=orjson.dumps(
+                {"value": [1], "@odata.nextLink": "https://graph/next"}
+            )
+        ),
+        mock_response(content=orjson.dumps({"value": [2]})),
+    ]
+
+    pages = list(connector._get_graph_pages("https://graph/first", {"$top": "1"}))
+
+    assert [page["value"] for page in pages] == [[1], [2]]
+    first_call, second_call = mock_graph_http["get"].call_args_list
+    assert first_call.kwargs["headers"] == {"Authorization": "Bearer first"}
+    assert first_call.kwargs["params"] == {"$top": "1"}
+    assert second_call.args[0] == "https://graph/next"
+    assert second_call.kwargs["headers"] == {"Authorization": "Bearer second"}
+    assert second_call.kwargs["params"] is None
@@ -0,0 +1,104 @@
+import base64
+from collections.abc import Callable
+from typing import Any
+
+from office365.onedrive.driveitems.driveItem import DriveItem  # type: ignore
+
+from onyx.connectors.sharepoint.connector import SharepointConnector
+from tests.unit.onyx.connectors.sharepoint.conftest import DRIVE_ID
+from tests.unit.onyx.connectors.sharepoint.conftest import mock_batch_response
+from tests.unit.onyx.connectors.sharepoint.conftest import mock_response
+
+
+def test_process_driveitem_group(
+    sharepoint_connector: SharepointConnector,
+    make_driveitem: Callable[..., DriveItem],
+    mock_graph_http: dict[str, Any],
+) -> None:
+    driveitems = [make_driveitem("redirected"), make_driveitem("inline")]
+    mock_graph_http["post"].return_value = mock_batch_response(
+        [
+            {
+                "id": "0",
+                "status": 302,
+                "headers": {"Location": "https://download.example.com/redirected"},
+            },
+            {
+                "id": "1",
+                "status": 200,
+                "body": base64.b64encode(b"inline content").decode(),
+            },
+        ]
+    )
+    mock_graph_http["get"].return_value = mock_response(
+        chunks=[b"redirected ", b"content"]
+    )
+
+    docs = sharepoint_connector._process_driveitem_group(
+        [(driveitem, "Shared Documents") for driveitem in driveitems]
+    )
+
+    assert [doc.id for doc in docs] == ["redirected", "inline"]
+    assert [doc.sections[0].text for doc in docs] == [
+        "redirected content",
+        "inline content",
+    ]
+    assert docs[0].metadata == {"drive": "Shared Documents"}
+
+    mock_graph_http["post"].assert_called_once()
+    batch_requests = mock_graph_http["post"].call_args.kwargs["json"]["requests"]
+    assert [request["url"] for request in batch_requests] == [
+        f"/drives/{DRIVE_ID}/items/redirected/content",
+        f"/drives/{DRIVE_ID}/items/inline/content",
+    ]
+    # the pre-authenticated download url is fetched without the bearer token
+    mock_graph_http["get"].assert_called_once()
+    assert (
+        mock_graph_http["get"].call_args.args[0]
+        == "https://download.example.com/redirected"
+    )
+    assert "headers" not in mock_graph_http["get"].call_args.kwargs
+
+
+def test_process_driveitem_group_retries_throttled_sub_requests(
+    sharepoint_connector: SharepointConnector,
+    make_driveitem: Callable[..., DriveItem],
+    mock_graph_http: dict[str, Any],
+) -> None:
+    driveitems = [make_driveitem("ok"), make_driveitem("throttled")]
+    mock_graph_http["post"].side_effect = [
+        mock_batch_response(
+            [
+                {"id": "0", "status": 200, "body": base64.b64encode(b"ok").decode()},
+                {"id": "1", "status": 429, "headers": {"Retry-After": "7"}},
+            ]
+        ),
+        mock_batch_response(
+            [
+                {
+                    "id": "1",
+                    "status": 200,
+                    "body": base64.b64encode(b"retried").decode(),
+                }
+            ]
+        ),
+    ]
+
+    docs = sharepoint_connector._process_driveitem_group(
+        [(driveitem, "Shared Documents") for driveitem in driveitems]
+    )
+
+    assert [doc.sections[0].text for doc in docs] == ["ok", "retried"]
+    # only the throttled item is requested again, after its Retry-After
+    assert mock_graph_http["post"].call_count == 2
+    retry_requests = mock_graph_http["post"].call_args.kwargs["json"]["requests"]
+    assert retry_requests == [
+        {
+            "id": "1",
+            "method": "GET",
+            "url": f"/drives/{DRIVE_ID}/items/throttled/content",
+        }
+    ]
+    mock_graph_http["sleep"].assert_called_once_with(7)
+    # nothing fell back to individual downloads
+    mock_graph_http["get"].assert_not_called()
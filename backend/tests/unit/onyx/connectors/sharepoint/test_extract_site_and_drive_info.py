@@ -0,0 +1,65 @@
+import pytest
+
+from onyx.connectors.sharepoint.connector import SharepointConnector
+from onyx.connectors.sharepoint.connector import SiteDescriptor
+
+SITE_URL = "https://tenant.sharepoint.com/sites/sharepoint-tests"
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        # plain site
+        (SITE_URL, SiteDescriptor(url=SITE_URL, drive_name=None, folder_path=None)),
+        # trailing slash
+        (
+            f"{SITE_URL}/",
+            SiteDescriptor(url=SITE_URL, drive_name=None, folder_path=None),
+        ),
+        # drive
+        (
+            f"{SITE_URL}/Shared%20Documents",
+            SiteDescriptor(
+                url=SITE_URL, drive_name="Shared Documents", folder_path=None
+            ),
+        ),
+        (
+            f"{SITE_URL}/Shared Documents/",
+            SiteDescriptor(
+                url=SITE_URL, drive_name="Shared Documents", folder_path=None
+            ),
+        ),
+        # nested folder
+        (
+            f"{SITE_URL}/Shared%20Documents/test/nested%20with%20spaces",
+            SiteDescriptor(
+                url=SITE_URL,
+                drive_name="Shared Documents",
+                folder_path="test/nested with spaces",
+            ),
+        ),
+        (
+            f"{SITE_URL}/Shared%20Documents/test/nested/",
+            SiteDescriptor(
+                url=SITE_URL, drive_name="Shared Documents", folder_path="test/nested"
+            ),
+        ),
+        # folder named "sites"
+        (
+            f"{SITE_URL}/Shared%20Documents/sites/archive",
+            SiteDescriptor(
+                url=SITE_URL,
+                drive_name="Shared Documents",
+                folder_path="sites/archive",
+            ),
+        ),
+    ],
+)
+def test_extract_site_and_drive_info(url: str, expected: SiteDescriptor) -> None:
+    assert SharepointConnector._extract_site_and_drive_info([url]) == [expected]
+
+
+def test_extract_site_and_drive_info_skips_non_site_urls() -> None:
+    assert SharepointConnector._extract_site_and_drive_info(
+        ["https://tenant.sharepoint.com/teams/some-team", SITE_URL]
+    ) == [SiteDescriptor(url=SITE_URL, drive_name=None, folder_path=None)]
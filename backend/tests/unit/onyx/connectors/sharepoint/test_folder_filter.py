@@ -0,0 +1,29 @@
+import pytest
+
+from onyx.connectors.sharepoint.connector import _is_in_folder
+
+
+@pytest.mark.parametrize(
+    "parent_path,folder_path,expected",
+    [
+        ("/drives/abc/root:/test", "test", True),
+        ("/drives/abc/root:/test/nested", "test", True),
+        ("/drives/abc/root:/test/nested", "/test/", True),
+        ("/drives/abc/root:/test/nested", "test/nested", True),
+        ("/drives/abc/root:", "test", False),
+        ("/drives/abc/root:/other", "test", False),
+        # a sibling sharing the folder's name as a prefix is not inside it
+        ("/drives/abc/root:/test2", "test", False),
+        ("/drives/abc/root:/test", "test/nested", False),
+        # Graph may return percent-encoded parent paths
+        (
+            "/drives/abc/root:/test/nested%20with%20spaces",
+            "test/nested with spaces",
+            True,
+        ),
+        ("/drives/abc/root:/caf%C3%A9/menu", "café", True),
+        ("/drives/abc/root:/with%20spaces2", "with spaces", False),
+    ],
+)
+def test_is_in_folder(parent_path: str, folder_path: str, expected: bool) -> None:
+    assert _is_in_folder(parent_path, folder_path) is expected
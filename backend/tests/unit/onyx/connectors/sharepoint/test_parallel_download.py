@@ -0,0 +1,258 @@
+import base64
+import io
+import tempfile
+import threading
+from collections.abc import Callable
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+import requests
+from office365.onedrive.driveitems.driveItem import DriveItem  # type: ignore
+
+from onyx.connectors.sharepoint.connector import _AdaptiveConcurrencyLimit
+from onyx.connectors.sharepoint.connector import GRAPH_BATCH_MAX_REQUESTS
+from onyx.connectors.sharepoint.connector import GRAPH_BATCH_MAX_RETRIES
+from onyx.connectors.sharepoint.connector import MAX_DOWNLOAD_WORKERS
+from onyx.connectors.sharepoint.connector import SharepointConnector
+from tests.unit.onyx.connectors.sharepoint.conftest import DRIVE_ID
+from tests.unit.onyx.connectors.sharepoint.conftest import mock_batch_response
+from tests.unit.onyx.connectors.sharepoint.conftest import mock_response
+
+
+class _CountingSpooledFile(tempfile.SpooledTemporaryFile):
+    """Tracks how many spooled files are open at the same time."""
+
+    lock = threading.Lock()
+    open_count = 0
+    max_open = 0
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        with self.lock:
+            _CountingSpooledFile.open_count += 1
+            _CountingSpooledFile.max_open = max(
+                _CountingSpooledFile.max_open, _CountingSpooledFile.open_count
+            )
+
+    def close(self) -> None:
+        if not self.closed:
+            with self.lock:
+                _CountingSpooledFile.open_count -= 1
+        super().close()
+
+    def __exit__(self, *args: Any) -> None:
+        # the base class closes the wrapped file without going through close()
+        self.close()
+
+
+@pytest.fixture
+def counting_spooled_file() -> Generator[type[_CountingSpooledFile], None, None]:
+    _CountingSpooledFile.open_count = 0
+    _CountingSpooledFile.max_open = 0
+    with patch(
+        "onyx.connectors.sharepoint.connector.tempfile.SpooledTemporaryFile",
+        _CountingSpooledFile,
+    ):
+        yield _CountingSpooledFile
+
+
+def _echo_batch(url: str, **kwargs: Any) -> MagicMock:
+    """Answer every content sub-request inline with the id of its item."""
+    return mock_batch_response(
+        [
+            {
+                "id": request["id"],
+                "status": 200,
+                "body": base64.b64encode(
+                    request["url"].split("/")[-2].encode()
+                ).decode(),
+            }
+            for request in kwargs["json"]["requests"]
+        ]
+    )
+
+
+def test_download_driveitem_content(
+    sharepoint_connector: SharepointConnector,
+    make_driveitem: Callable[..., DriveItem],
+    mock_graph_http: dict[str, Any],
+) -> None:
+    mock_graph_http["get"].return_value = mock_response(chunks=[b"file ", b"content"])
+
+    file_object = io.BytesIO()
+    sharepoint_connector._download_driveitem_content(make_driveitem("a"), file_object)
+
+    assert file_object.getvalue() == b"file content"
+    mock_graph_http["get"].assert_called_once()
+    assert (
+        mock_graph_http["get"].call_args.args[0]
+        == f"https://graph.microsoft.com/v1.0/drives/{DRIVE_ID}/items/a/content"
+    )
+    assert mock_graph_http["get"].call_args.kwargs["headers"] == {
+        "Authorization": "Bearer test-token"
+    }
+    mock_graph_http["sleep"].assert_not_called()
+
+
+def test_download_driveitem_content_retries_throttled_request(
+    sharepoint_connector: SharepointConnector,
+    make_driveitem: Callable[..., DriveItem],
+    mock_graph_http: dict[str, Any],
+) -> None:
+    mock_graph_http["get"].side_effect = [
+        mock_response(status_code=429, headers={"Retry-After": "3"}),
+        mock_response(chunks=[b"file content"]),
+    ]
+
+    file_object = io.BytesIO()
+    sharepoint_connector._download_driveitem_content(make_driveitem("a"), file_object)
+
+    assert file_object.getvalue() == b"file content"
+    assert mock_graph_http["get"].call_count == 2
+    mock_graph_http["sleep"].assert_called_once_with(3)
+    assert sharepoint_connector._download_concurrency.limit < MAX_DOWNLOAD_WORKERS
+
+
+def test_download_driveitem_content_gives_up_when_throttled(
+    sharepoint_connector: SharepointConnector,
+    make_driveitem: Callable[..., DriveItem],
+    mock_graph_http: dict[str, Any],
+) -> None:
+    mock_graph_http["get"].side_effect = lambda *args, **kwargs: mock_response(
+        status_code=429, headers={"Retry-After": "1"}
+    )
+
+    with pytest.raises(requests.HTTPError):
+        sharepoint_connector._download_driveitem_content(
+            make_driveitem("a"), io.BytesIO(), max_retries=2
+        )
+
+    assert mock_graph_http["get"].call_count == 3
+    assert mock_graph_http["sleep"].call_count == 2
+
+
+def test_process_driveitem_group_falls_back_to_individual_downloads(
+    sharepoint_connector: SharepointConnector,
+    make_driveitem: Callable[..., DriveItem],
+    mock_graph_http: dict[str, Any],
+    counting_spooled_file: type[_CountingSpooledFile],
+) -> None:
+    mock_graph_http["post"].side_effect = lambda *args, **kwargs: mock_batch_response(
+        [{"id": request["id"], "status": 429} for request in kwargs["json"]["requests"]]
+    )
+    mock_graph_http["get"].side_effect = lambda *args, **kwargs: mock_response(
+        chunks=[b"individual"]
+    )
+    driveitems = [make_driveitem(f"item{idx}") for idx in range(3)]
+
+    docs = sharepoint_connector._process_driveitem_group(
+        [(driveitem, "Shared Documents") for driveitem in driveitems]
+    )
+
+    assert [doc.sections[0].text for doc in docs] == ["individual"] * 3
+    assert mock_graph_http["post"].call_count == GRAPH_BATCH_MAX_RETRIES + 1
+    assert mock_graph_http["get"].call_count == 3
+    # files are downloaded and converted one at a time
+    assert counting_spooled_file.max_open == 1
+    assert counting_spooled_file.open_count == 0
+
+
+def test_convert_driveitems_in_parallel(
+    sharepoint_connector: SharepointConnector,
+    make_driveitem: Callable[..., DriveItem],
+    mock_graph_http: dict[str, Any],
+    counting_spooled_file: type[_CountingSpooledFile],
+) -> None:
+    mock_graph_http["post"].side_effect = _echo_batch
+    item_count = GRAPH_BATCH_MAX_REQUESTS * MAX_DOWNLOAD_WORKERS * 2 + 5
+    driveitems = [
+        (make_driveitem(f"item{idx}"), "Shared Documents") for idx in range(item_count)
+    ]
+
+    docs = list(sharepoint_connector._convert_driveitems_in_parallel(driveitems))
+
+    assert sorted(doc.id for doc in docs) == sorted(
+        driveitem.id for driveitem, _ in driveitems
+    )
+    assert all(doc.sections[0].text == doc.id for doc in docs)
+    # one $batch per group of GRAPH_BATCH_MAX_REQUESTS items
+    assert mock_graph_http["post"].call_count == -(
+        -item_count // GRAPH_BATCH_MAX_REQUESTS
+    )
+    mock_graph_http["get"].assert_not_called()
+    assert counting_spooled_file.max_open <= MAX_DOWNLOAD_WORKERS
+    assert counting_spooled_file.open_count == 0
+
+
+def test_convert_driveitems_in_parallel_backs_off_when_throttled(
+    sharepoint_connector: SharepointConnector,
+    make_driveitem: Callable[..., DriveItem],
+    mock_graph_http: dict[str, Any],
+) -> None:
+    throttled_once: set[str] = set()
+    lock = threading.Lock()
+
+    def _throttle_first_attempt(url: str, **kwargs: Any) -> MagicMock:
+        sub_responses = []
+        for request in kwargs["json"]["requests"]:
+            item_id = request["url"].split("/")[-2]
+            with lock:
+                first_attempt = item_id not in throttled_once
+                throttled_once.add(item_id)
+            if first_attempt:
+                sub_responses.append({"id": request["id"], "status": 429})
+            else:
+                sub_responses.append(
+                    {
+                        "id": request["id"],
+                        "status": 200,
+                        "body": base64.b64encode(item_id.encode()).decode(),
+                    }
+                )
+        return mock_batch_response(sub_responses)
+
+    mock_graph_http["post"].side_effect = _throttle_first_attempt
+    item_count = GRAPH_BATCH_MAX_REQUESTS * 4
+    driveitems = [
+        (make_driveitem(f"item{idx}"), "Shared Documents") for idx in range(item_count)
+    ]
+
+    limits: list[int] = []
+    original_on_throttle = sharepoint_connector._download_concurrency.on_throttle
+
+    def _record_on_throttle() -> None:
+        original_on_throttle()
+        limits.append(sharepoint_connector._download_concurrency.limit)
+
+    with patch.object(
+        sharepoint_connector._download_concurrency,
+        "on_throttle",
+        side_effect=_record_on_throttle,
+    ):
+        docs = list(sharepoint_connector._convert_driveitems_in_parallel(driveitems))
+
+    assert len(docs) == item_count
+    # every group was throttled once and shrank the limit
+    assert len(limits) == 4
+    assert min(limits) < MAX_DOWNLOAD_WORKERS
+    mock_graph_http["get"].assert_not_called()
+
+
+def test_adaptive_concurrency_limit() -> None:
+    concurrency = _AdaptiveConcurrencyLimit(max_limit=8)
+
+    concurrency.on_throttle()
+    assert concurrency.limit == 4
+    concurrency.on_throttle()
+    concurrency.on_throttle()
+    concurrency.on_throttle()
+    assert concurrency.limit == 1
+
+    concurrency.on_success()
+    assert concurrency.limit == 2
+    for _ in range(10):
+        concurrency.on_success()
+    assert concurrency.limit == 8
@@ -0,0 +1,26 @@
+from collections.abc import Callable
+
+from office365.onedrive.driveitems.driveItem import DriveItem  # type: ignore
+
+from onyx.configs.app_configs import SHAREPOINT_CONNECTOR_SIZE_THRESHOLD
+from onyx.connectors.sharepoint.connector import _exceeds_size_threshold
+
+
+def test_exceeds_size_threshold(make_driveitem: Callable[..., DriveItem]) -> None:
+    assert _exceeds_size_threshold(
+        make_driveitem("huge", size=SHAREPOINT_CONNECTOR_SIZE_THRESHOLD + 1)
+    )
+    assert _exceeds_size_threshold(make_driveitem("terabyte", size=1024**4))
+    assert not _exceeds_size_threshold(
+        make_driveitem("limit", size=SHAREPOINT_CONNECTOR_SIZE_THRESHOLD)
+    )
+    assert not _exceeds_size_threshold(make_driveitem("small", size=10))
+
+
+def test_exceeds_size_threshold_without_size(
+    make_driveitem: Callable[..., DriveItem],
+) -> None:
+    driveitem = make_driveitem("unknown")
+    del driveitem.properties["size"]
+
+    assert not _exceeds_size_threshold(driveitem)